@@ -32,23 +32,191 @@ TO DO:
 - Add docstrings throughout!
 """
 
-import math
+import codecs
+import contextlib
+import os
 import pathlib
 import textwrap
+import threading
 import time
-from typing import Any, BinaryIO, Union
+import warnings
+from typing import Any, BinaryIO, Iterator, Optional, Tuple, Union
 
 import PIL
-from PIL import Image
+from PIL import Image, ImageChops
 from serial import Serial
 
 from .enums import Barcode, Charset, Codepage, PrintMode
 
 
+_BARCODE_NEW = {  # UPC codes & values for firmware_version >= 264
+    Barcode.UPC_A: 65,
+    Barcode.UPC_E: 66,
+    Barcode.EAN13: 67,
+    Barcode.EAN8: 68,
+    Barcode.CODE39: 69,
+    Barcode.ITF: 70,
+    Barcode.CODABAR: 71,
+    Barcode.CODE93: 72,
+    Barcode.CODE128: 73,
+    Barcode.I25: -1,  # NOT IN NEW FIRMWARE
+    Barcode.CODEBAR: -1,
+    Barcode.CODE11: -1,
+    Barcode.MSI: -1
+}
+_BARCODE_OLD = {  # UPC codes & values for firmware_version < 264
+    Barcode.UPC_A: 0,
+    Barcode.UPC_E: 1,
+    Barcode.EAN13: 2,
+    Barcode.EAN8: 3,
+    Barcode.CODE39: 4,
+    Barcode.I25: 5,
+    Barcode.CODEBAR: 6,
+    Barcode.CODE93: 7,
+    Barcode.CODE128: 8,
+    Barcode.CODE11: 9,
+    Barcode.MSI: 10,
+    Barcode.ITF: -1,  # NOT IN OLD FIRMWARE
+    Barcode.CODABAR: -1
+}
+
+
+def _barcode_commands(codes: dict) -> dict:
+    """Build the command that starts each supported type of barcode.
+
+    :param codes: the barcode codes, with -1 for unsupported types
+    :type codes: dict
+    :return: the command for each supported barcode type
+    """
+
+    return {
+        style: bytes([
+            29, 72, 2,  # Print label below barcode
+            29, 119, 3,  # Barcode width
+            29, 107, n])  # Barcode type
+        for style, n in codes.items() if n != -1
+    }
+
+
+_BARCODE_COMMANDS_NEW = _barcode_commands(_BARCODE_NEW)
+_BARCODE_COMMANDS_OLD = _barcode_commands(_BARCODE_OLD)
+
+# Fixed command sequences
+_INIT = bytes([27, 64])  # Esc @ = init command
+_TAB_STOPS = bytes([
+    27, 68,  # Set tab stops
+    4, 8, 12, 16,  # every 4 columns,
+    20, 24, 28, 0])  # 0 is end-of-list.
+_FORM_FEED = bytes([12])
+_ONLINE = bytes([27, 61, 1])
+_OFFLINE = bytes([27, 61, 0])
+_INVERSE_ON = bytes([29, 66, 1])
+_INVERSE_OFF = bytes([29, 66, 0])
+_SIDEWAYS_ON = bytes([27, 86, 1])
+_SIDEWAYS_OFF = bytes([27, 86, 0])
+_UNDERLINE = (bytes([27, 45, 0]), bytes([27, 45, 1]), bytes([27, 45, 2]))
+_PRINT_MODES = tuple(bytes([27, 33, n]) for n in range(256))
+_JUSTIFY = {
+    "L": bytes([0x1B, 0x61, 0]),
+    "C": bytes([0x1B, 0x61, 1]),
+    "R": bytes([0x1B, 0x61, 2])
+}
+
+# Text sizes: command, char height, and max columns for the normal and
+# alternative fonts
+_SIZES = {
+    "S": (bytes([29, 33, 0x00]), 24, 32, 42),  # Single height, single width
+    "M": (bytes([29, 33, 0x01]), 48, 32, 42),  # Double height, single width
+    "L": (bytes([29, 33, 0x11]), 48, 16, 21)  # Double height, double width
+}
+
+# Char height and max columns, by double height, double width, and
+# whether the alternative font is in use
+_GEOMETRY = {
+    (False, False, False): (24, 32),
+    (False, False, True): (24, 42),
+    (False, True, False): (24, 16),
+    (False, True, True): (24, 21),
+    (True, False, False): (48, 32),
+    (True, False, True): (48, 42),
+    (True, True, False): (48, 16),
+    (True, True, True): (48, 21)
+}
+
+_encode_cp437 = codecs.getencoder("cp437")
+
+# Most bytes to hold back in the transmit buffer before sending them,
+# kept small so a full buffer can't overrun the printer's own buffer
+_TX_BUFFER_SIZE = 256
+
+# Seconds to hold back data in the transmit buffer for more to arrive
+_TX_FLUSH_DELAY = 0.002
+
+# Seconds the thread that sends held-back data waits idle before it stops
+_TX_FLUSHER_IDLE = 0.5
+
+# Seconds to reuse the result of has_paper() for
+_PAPER_STATUS_TTL = 0.1
+
+# NV memory for bitmaps (in bytes) and seconds the printer is assumed to
+# take to write each byte of it.  The manual doesn't give a write speed,
+# so this is a conservative guess (about 20 s to fill the whole memory).
+_NV_BITMAP_MEMORY = 192 * 1024
+_NV_WRITE_TIME = 0.0001
+
+# 8x8 Bayer matrix for ordered dithering, scaled to 0-255 thresholds
+_BAYER8 = tuple(bytes(4 * v + 2 for v in row) for row in (
+    (0, 32, 8, 40, 2, 34, 10, 42),
+    (48, 16, 56, 24, 50, 18, 58, 26),
+    (12, 44, 4, 36, 14, 46, 6, 38),
+    (60, 28, 52, 20, 62, 30, 54, 22),
+    (3, 35, 11, 43, 1, 33, 9, 41),
+    (51, 19, 59, 27, 49, 17, 57, 25),
+    (15, 47, 7, 39, 13, 45, 5, 37),
+    (63, 31, 55, 23, 61, 29, 53, 21)
+))
+
+
+def _bayer_dither(image: PIL.Image.Image) -> PIL.Image.Image:
+    """Convert an image to 1-bit using an 8x8 ordered dither.
+
+    :param image: the image to convert
+    :type image: PIL.Image.Image
+    :return: the dithered 1-bit image
+    """
+
+    gray = image.convert("L")
+    width, height = gray.size
+
+    # Tile the matrix across the whole image, then set each pixel
+    # brighter than its threshold to white
+    tiles_across = (width + 7) // 8
+    block = b"".join((row * tiles_across)[:width] for row in _BAYER8)
+    threshold = Image.frombytes(
+        "L", gray.size, (block * ((height + 7) // 8))[:width * height])
+    return ImageChops.subtract(gray, threshold).point(
+        lambda p: 255 if p else 0, "1")
+
+
+class Recording(bytearray):
+    """Data recorded by AdafruitThermal.record().
+
+    The duration is how long the printer takes to print or feed the data
+    (not counting the time to receive it), in seconds.
+    """
+
+    duration = 0.0
+
+
 class AdafruitThermal(Serial):
     """Represents the thermal printer."""
 
     resume_time = 0.0
+    _needs_wait = False
+    _flow_control = False
+    _batching = 0
+    _recording = None
+    _paper_status = None
     byte_time = 0.0
     dot_print_time = 0.0
     dot_feed_time = 0.0
@@ -63,10 +231,22 @@ class AdafruitThermal(Serial):
     firmware_version = 268
     sideways = False
     alt_font = False
+    nv_bitmap_heights = ()
+    _blank_line_time = 0.0
+    _text_line_time = 0.0
 
     def __init__(self, port: str, baudrate: int, *args, **kwargs):
         """Initialise the printer.
 
+        The baud rate must match the printer's, which is printed on its
+        self-test page (hold the feed button while turning it on).
+
+        Any other arguments are passed on to serial.Serial.  Pass
+        "rtscts=True" to use hardware flow control, which needs the
+        printer's flow control (DTR/RTS) pin wired to the CTS pin of the
+        serial port.  The printer then tells us when it's busy, instead
+        of us estimating how long each task takes.
+
         :param port: the port of the printer
         :type port: str
         :param baudrate: the baudrate of the printer
@@ -77,7 +257,13 @@ class AdafruitThermal(Serial):
         # with the "firmware=X" argument, where X is the major
         # version number * 100 + the minor version number (e.g.
         # pass "firmware=264" for version 2.64.
-        self.firmware_version = kwargs.get("firmware", 268)
+        self.firmware_version = kwargs.pop("firmware", 268)
+        heat_time = kwargs.pop("heattime", self.default_heat_time)
+
+        # USB serial adapters can hold back small writes for several
+        # milliseconds.  Pass "low_latency=True" to ask the driver to
+        # send them straight away instead.
+        low_latency = kwargs.pop("low_latency", False)
 
         # Calculate time to issue one byte to the printer.
         # 11 bits (not 8) to accommodate idle, start and
@@ -85,7 +271,20 @@ class AdafruitThermal(Serial):
         # erring on side of caution here.
         self.byte_time = 11.0 / float(baudrate)
 
+        # Commands that don't print or feed anything are held back in
+        # this buffer and sent along with whatever comes next, or by a
+        # background thread if nothing else comes soon
+        self._tx_buf = bytearray()
+        self._tx_time = 0.0
+        self._tx_lock = threading.RLock()
+        self._tx_ready = threading.Condition(self._tx_lock)
+        self._tx_deadline = None
+        self._tx_flusher = None
+        self._tx_error = None
+
         Serial.__init__(self, port, baudrate, *args, **kwargs)
+        if low_latency:
+            self._set_low_latency()
 
         # The printer can't start receiving data immediately upon
         # power up -- it needs a moment to cold boot and initialize.
@@ -110,7 +309,6 @@ class AdafruitThermal(Serial):
         # may occur.  The more heating interval, the more
         # clear, but the slower printing speed.
 
-        heat_time = kwargs.get("heattime", self.default_heat_time)
         self.write_bytes(
             27,  # Esc
             55,  # 7 (print settings)
@@ -136,13 +334,47 @@ class AdafruitThermal(Serial):
             (print_break_time << 5) | print_density)
         self.dot_print_time = 0.03
         self.dot_feed_time = 0.0021
+        self._recompute_line_times()
+
+        # Enable RTS flow control (GS a, bit 5) so the printer holds us
+        # off while it's busy, and stop estimating timeouts ourselves
+        if self.rtscts:
+            self.write_bytes(29, 97, 1 << 5)
+            self._flush_tx()
+            self._flow_control = True
+            self._needs_wait = False
+
+    def _set_low_latency(self) -> None:
+        """Ask the serial driver to send small writes without delay.
+
+        This sets the driver's low latency flag and, for USB serial
+        adapters that have one (e.g. FTDI), drops the adapter's latency
+        timer from the default 16 ms to 1 ms.  Either may need extra
+        permissions, so failures only give a warning.
+        """
+
+        try:
+            self.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError) as e:
+            warnings.warn("Could not enable low latency mode: %s" % e)
+
+        name = os.path.basename(os.path.realpath(self.port))
+        path = "/sys/bus/usb-serial/devices/%s/latency_timer" % name
+        if os.path.exists(path):
+            try:
+                with open(path, "w") as latency_timer:
+                    latency_timer.write("1")
+            except OSError as e:
+                warnings.warn("Could not set the latency timer: %s" % e)
 
     def timeout_set(self, duration: float):
         """Sets the estimated completion time for a just-issued task.
 
-        Because there's no flow control between the printer and
-        computer, special care must be taken to avoid overrunning the
-        printer's buffer.
+        Unless the port was opened with hardware flow control (see
+        __init__()), there's no flow control between the printer and
+        computer, so special care must be taken to avoid overrunning
+        the printer's buffer.  With flow control the printer holds us
+        off itself, so the timeout is ignored.
 
         Serial output is throttled based on serial speed as well as an
         estimate of the device's print and feed rates (relatively slow,
@@ -157,17 +389,41 @@ class AdafruitThermal(Serial):
         receiving or decoding an image) while the printer physically
         completes the task.
 
+        Any data held back in the transmit buffer is sent first, as
+        it's part of the just-issued task.  Inside a batch, the duration
+        is added to the batch's time instead.
+
         :param duration: how long to wait in seconds
         :type duration: float
         """
 
-        self.resume_time = time.time() + duration
+        with self._tx_lock:
+            if self._recording is not None:
+                self._recording.duration += duration
+                return
+            if self._batching:
+                self._tx_time += duration
+                return
+            self._flush_tx()
+            self.resume_time = time.monotonic() + duration
+            self._needs_wait = duration > 0 and not self._flow_control
 
     def timeout_wait(self):
         """Waits (if necessary) for the prior task to complete."""
 
-        while (time.time() - self.resume_time) < 0:
+        # Skip reading the clock if we've already waited since the
+        # last timeout was set
+        if not self._needs_wait:
+            return
+
+        # Sleep through most of the wait, but spin for the last
+        # millisecond as sleep() can overshoot short delays
+        remaining = self.resume_time - time.monotonic()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        while time.monotonic() < self.resume_time:
             pass
+        self._needs_wait = False
 
     def set_times(self, print_time: int, feed_time: int) -> None:
         """Set the print and feed times.
@@ -201,6 +457,246 @@ class AdafruitThermal(Serial):
         # compatibility with Arduino library
         self.dot_print_time = print_time / 1000000.0
         self.dot_feed_time = feed_time / 1000000.0
+        self._recompute_line_times()
+
+    def _recompute_line_times(self) -> None:
+        """Recompute the time taken to feed a blank line or print a text line.
+
+        This must be called whenever the char height, line spacing or the
+        print and feed times change.
+        """
+
+        self._blank_line_time = ((self.char_height + self.line_spacing) *
+                                 self.dot_feed_time)
+        self._text_line_time = ((self.char_height * self.dot_print_time) +
+                                (self.line_spacing * self.dot_feed_time))
+
+    def _send(self, data: bytes, print_time: float = 0.0) -> None:
+        """Send data to the printer, holding it back if possible.
+
+        Data that only takes the printer as long to process as it takes to
+        receive (i.e. control commands) is held back in the transmit
+        buffer, so that runs of commands go out in a single write.  Data
+        that prints or feeds paper is sent straight away, along with
+        anything held back before it, so the timeout model stays accurate.
+        Anything else is sent by a background thread a couple of
+        milliseconds later, unless more data arrives first.
+
+        If the background thread failed to send data, its error is raised
+        here instead, and the data is kept to be sent again.
+
+        :param data: the bytes to send
+        :type data: bytes
+        :param print_time: how long the printer will spend printing or
+            feeding after receiving the data, in seconds
+        :type print_time: float, optional
+        """
+
+        with self._tx_lock:
+            self._raise_tx_error()
+            if self._recording is not None:
+                self._recording += data
+                self._recording.duration += print_time
+                return
+            self._tx_buf += data
+            self._tx_time += len(data) * self.byte_time + print_time
+            if self._batching:
+                return
+            if print_time > 0 or len(self._tx_buf) >= _TX_BUFFER_SIZE:
+                self._flush_tx()
+            elif self._tx_deadline is None:
+                self._tx_deadline = time.monotonic() + _TX_FLUSH_DELAY
+                if self._tx_flusher is None:
+                    self._tx_flusher = threading.Thread(
+                        target=self._run_tx_flusher, name="AdafruitThermal")
+                    self._tx_flusher.start()
+                else:
+                    self._tx_ready.notify()
+
+    def _run_tx_flusher(self) -> None:
+        """Send held-back data once it's been held back for long enough.
+
+        This runs in a background thread, which stops once it's been idle
+        for a while so it doesn't keep the program running.  Errors are
+        kept for _send() or _flush_tx() to raise in the caller's thread.
+        """
+
+        with self._tx_lock:
+            while True:
+                if self._tx_deadline is None:
+                    if (not self._tx_ready.wait(_TX_FLUSHER_IDLE) and
+                            self._tx_deadline is None):
+                        self._tx_flusher = None
+                        return
+                    continue
+
+                remaining = self._tx_deadline - time.monotonic()
+                if remaining > 0:
+                    self._tx_ready.wait(remaining)
+                    continue
+                self._tx_deadline = None
+                if self._batching or self._tx_error is not None:
+                    continue
+
+                # Don't hold the lock while the printer finishes its last
+                # task, just try again once it should have done
+                if self._needs_wait and self.resume_time > time.monotonic():
+                    self._tx_deadline = self.resume_time
+                    continue
+                try:
+                    self._flush_tx()
+                except Exception as error:
+                    self._tx_error = error
+
+    def _raise_tx_error(self) -> None:
+        """Raise any error from sending data in the background thread."""
+
+        if self._tx_error is not None:
+            error = self._tx_error
+            self._tx_error = None
+            raise error
+
+    def begin_batch(self) -> None:
+        """Start holding back everything sent to the printer.
+
+        Nothing is sent until the matching end_batch() call, when it all
+        goes out in a single write with a single timeout covering it.
+        Batches can be nested, in which case everything is sent when the
+        outermost one ends.
+
+        There's no flow control, so keep batches small enough to fit in
+        the printer's buffer (e.g. a few lines or a barcode).
+        """
+
+        with self._tx_lock:
+            self._batching += 1
+
+    def end_batch(self) -> None:
+        """Finish a batch started by begin_batch().
+
+        :raises RuntimeError: if there's no batch to finish
+        """
+
+        with self._tx_lock:
+            if not self._batching:
+                raise RuntimeError("end_batch() called without begin_batch().")
+            self._batching -= 1
+            if not self._batching:
+                self._flush_tx()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Batch everything sent within the block.
+
+        See begin_batch() for details.
+        """
+
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    @contextlib.contextmanager
+    def record(self) -> Iterator[Recording]:
+        """Record everything sent within the block instead of sending it.
+
+        The recording can be saved and sent later with replay(), e.g. to
+        print a fixed receipt or test page in a single write.  Nothing is
+        sent to the printer during the block, so don't call has_paper().
+
+        The time the printer takes to print the recording is added up as
+        well, in its duration.  Save that too if you save the recording.
+
+        The printer's state (print mode, column, sizes etc.) is tracked
+        while recording as if it was sent, but replay() doesn't restore
+        it, so replaying a recording that changes it leaves this out of
+        step with the printer.
+
+        :return: the recording, which is filled in as the block runs
+        :rtype: Iterator[Recording]
+        :raises RuntimeError: if already recording or inside a batch
+        """
+
+        with self._tx_lock:
+            if self._recording is not None:
+                raise RuntimeError("Already recording.")
+            if self._batching:
+                raise RuntimeError("Can't record inside a batch.")
+            self._flush_tx()
+            recording = self._recording = Recording()
+        try:
+            yield recording
+        finally:
+            with self._tx_lock:
+                self._recording = None
+
+    def replay(self, data: bytes, duration: Optional[float] = None) -> None:
+        """Send a recording made by record().
+
+        Without flow control the printer can't say when it's busy, so it's
+        assumed to take the recording's duration to print it.  Pass the
+        duration if the recording was saved as plain bytes, and keep
+        recordings small enough to fit in the printer's buffer.
+
+        :param data: the recording
+        :type data: bytes
+        :param duration: how long the printer takes to print it, in
+            seconds, if not the recording's duration
+        :type duration: Optional[float], optional
+        """
+
+        if duration is None:
+            duration = getattr(data, "duration", 0.0)
+        self._send(bytes(data), duration)
+
+    def _flush_tx(self) -> None:
+        """Send any data held back in the transmit buffer.
+
+        Large buffers (e.g. bitmaps or batches) are sent in chunks no
+        bigger than the printer's buffer, waiting for each chunk to be
+        received before sending the next, so a write never gets far
+        ahead of the printer.
+        """
+
+        with self._tx_lock:
+            self._raise_tx_error()
+            self._tx_deadline = None
+            if not self._tx_buf:
+                return
+
+            # Swap in a fresh buffer rather than copying this one first.
+            # Serial.write() still copies each chunk into bytes.
+            data = memoryview(self._tx_buf)
+            tx_time = self._tx_time
+            self._tx_buf = bytearray()
+            self._tx_time = 0.0
+
+            for start in range(0, len(data), _TX_BUFFER_SIZE):
+                chunk = data[start:start + _TX_BUFFER_SIZE]
+                self.timeout_wait()
+                try:
+                    super(AdafruitThermal, self).write(chunk)
+                except Exception:
+                    # Keep what wasn't sent, so it's sent again next time
+                    self._tx_buf[:0] = data[start:]
+                    self._tx_time += tx_time - start * self.byte_time
+                    raise
+                self.resume_time = (time.monotonic() +
+                                    len(chunk) * self.byte_time)
+                self._needs_wait = not self._flow_control
+
+            # Then wait for whatever the data prints or feeds
+            self.resume_time += tx_time - len(data) * self.byte_time
+
+    def close(self) -> None:
+        """Send any data held back in the transmit buffer and close."""
+
+        try:
+            if self.is_open:
+                self._flush_tx()
+        finally:
+            super(AdafruitThermal, self).close()
 
     def write_bytes(self, *args):
         """Write raw bytes.
@@ -209,10 +705,7 @@ class AdafruitThermal(Serial):
         :type args: Tuple[Any, ...]
         """
 
-        for arg in args:
-            self.timeout_wait()
-            self.timeout_set(len(args) * self.byte_time)
-            super(AdafruitThermal, self).write(bytes([arg]))
+        self._send(bytes(args))
 
     def write(self, *data):
         """Write bytes.
@@ -223,34 +716,32 @@ class AdafruitThermal(Serial):
         :type data: Tuple[Any, ...]
         """
 
-        for i in range(len(data)):
-            c = data[i]
-            if c != 0x13:
-                self.timeout_wait()
-                super(AdafruitThermal, self).write(c)
-                d = self.byte_time
-                if ((c == "\n") or
-                        (self.column == self.max_column)):
-                    # Newline or wrap
-                    if self.prev_byte == "\n":
-                        # Feed line (blank)
-                        d += ((self.char_height +
-                               self.line_spacing) *
-                              self.dot_feed_time)
-                    else:
-                        # Text line
-                        d += ((self.char_height *
-                               self.dot_print_time) +
-                              (self.line_spacing *
-                               self.dot_feed_time))
-                        self.column = 0
-                        # Treat wrap as newline
-                        # on next pass
-                        c = "\n"
+        # Work out how long the printer will take to process the data
+        # first, so it can all be sent in a single write.  Latin-1 maps
+        # each byte to the character with the same value.  Like the
+        # Arduino library, each newline or wrap is given a full line's
+        # print time, so text can't run ahead of the printer.
+        buf = b"".join(data).replace(b"\x13", b"")
+        d = 0.0
+        for c in buf.decode("latin-1"):
+            if ((c == "\n") or
+                    (self.column == self.max_column)):
+                # Newline or wrap
+                if self.prev_byte == "\n":
+                    # Feed line (blank)
+                    d += self._blank_line_time
                 else:
-                    self.column += 1
-                self.timeout_set(d)
-                self.prev_byte = c
+                    # Text line
+                    d += self._text_line_time
+                    self.column = 0
+                    # Treat wrap as newline
+                    # on next pass
+                    c = "\n"
+            else:
+                self.column += 1
+            self.prev_byte = c
+
+        self._send(buf, d)
 
     def set_heat_time(self, heat_time: int = default_heat_time):
         """Sets the heat time.
@@ -269,37 +760,39 @@ class AdafruitThermal(Serial):
 
     def reset(self):
         """Resets the printer."""
-        self.write_bytes(27, 64)  # Esc @ = init command
-        self.prev_byte = "\n"  # Treat as if prior line is blank
-        self.column = 0
-        self.max_column = 32
-        self.char_height = 24
-        self.line_spacing = 6
-        self.barcode_height = 50
-        if self.firmware_version >= 264:
-            # Configure tab stops on recent printers
-            self.write_bytes(27, 68)  # Set tab stops
-            self.write_bytes(4, 8, 12, 16)  # every 4 columns,
-            self.write_bytes(20, 24, 28, 0)  # 0 is end-of-list.
+        with self.batch():
+            self._send(_INIT)
+            self.prev_byte = "\n"  # Treat as if prior line is blank
+            self.column = 0
+            self.max_column = 32
+            self.char_height = 24
+            self.line_spacing = 6
+            self.barcode_height = 50
+            self._recompute_line_times()
+            if self.firmware_version >= 264:
+                # Configure tab stops on recent printers
+                self._send(_TAB_STOPS)
 
     def set_default(self) -> None:
         """Restores default text formatting."""
 
-        self.online()
-        self.inverse(False)
-        self.upside_down(False)
-        self.double_height(False)
-        self.double_width(False)
-        self.strikethrough(False)
-        self.bold(False)
-        self.rotate_sideways(False)
-        self.small_font(False)
-        self.justify("L")
-        self.set_size("S")
-        self.underline(0)
-        self.set_barcode_height()
-        self.set_charset()
-        self.set_code_page()
+        self._paper_status = None
+        with self.batch():
+            self.online()
+            self.inverse(False)
+            self.upside_down(False)
+            self.double_height(False)
+            self.double_width(False)
+            self.strikethrough(False)
+            self.bold(False)
+            self.rotate_sideways(False)
+            self.small_font(False)
+            self.justify("L")
+            self.set_size("S")
+            self.underline(0)
+            self.set_barcode_height()
+            self.set_charset()
+            self.set_code_page()
 
     def test(self):
         self.write("Hello world!".encode("cp437", "ignore"))
@@ -333,67 +826,29 @@ class AdafruitThermal(Serial):
         :raises TypeError: if the barcode style isn't supported
         """
 
-        new_dict = {  # UPC codes & values for firmware_version >= 264
-            Barcode.UPC_A: 65,
-            Barcode.UPC_E: 66,
-            Barcode.EAN13: 67,
-            Barcode.EAN8: 68,
-            Barcode.CODE39: 69,
-            Barcode.ITF: 70,
-            Barcode.CODABAR: 71,
-            Barcode.CODE93: 72,
-            Barcode.CODE128: 73,
-            Barcode.I25: -1,  # NOT IN NEW FIRMWARE
-            Barcode.CODEBAR: -1,
-            Barcode.CODE11: -1,
-            Barcode.MSI: -1
-        }
-        old_dict = {  # UPC codes & values for firmware_version < 264
-            Barcode.UPC_A: 0,
-            Barcode.UPC_E: 1,
-            Barcode.EAN13: 2,
-            Barcode.EAN8: 3,
-            Barcode.CODE39: 4,
-            Barcode.I25: 5,
-            Barcode.CODEBAR: 6,
-            Barcode.CODE93: 7,
-            Barcode.CODE128: 8,
-            Barcode.CODE11: 9,
-            Barcode.MSI: 10,
-            Barcode.ITF: -1,  # NOT IN OLD FIRMWARE
-            Barcode.CODABAR: -1
-        }
-
-        # Get the code for the barcode
+        # Get the command for the barcode
         if self.firmware_version >= 264:
-            n = new_dict[style]
+            command = _BARCODE_COMMANDS_NEW.get(style)
         else:
-            n = old_dict[style]
-        if n == -1:
+            command = _BARCODE_COMMANDS_OLD.get(style)
+        if command is None:
             raise TypeError("Barcode %s is not supported in firmware %d." %
                             (style.name, self.firmware_version))
 
         self.feed()  # Recent firmware requires this?
-        self.write_bytes(
-            29, 72, 2,  # Print label below barcode
-            29, 119, 3,  # Barcode width
-            29, 107, n)  # Barcode type
-        self.timeout_wait()
-        self.timeout_set((self.barcode_height + 40) * self.dot_print_time)
 
         # Print string
         if self.firmware_version >= 264:
             # Recent firmware: write length byte + string sans NUL
-            n = len(text)
-            if n > 255:
-                n = 255
-            super(AdafruitThermal, self).write((chr(n)).encode("utf-8", "ignore"))
-            for i in range(n):
-                super(AdafruitThermal,
-                      self).write(text[i].encode("utf-8", "ignore"))
+            data = text.encode("utf-8", "ignore")[:255]
+            command += bytes([len(data)]) + data
         else:
             # Older firmware: write string + NUL
-            super(AdafruitThermal, self).write(text.encode("utf-8", "ignore"))
+            command += text.encode("utf-8", "ignore")
+
+        # Send the whole barcode in one write
+        self._send(command,
+                   (self.barcode_height + 40) * self.dot_print_time)
         self.prev_byte = "\n"
 
     def set_print_mode(self, mask: PrintMode) -> None:
@@ -402,7 +857,7 @@ class AdafruitThermal(Serial):
         :param mask: the print mode to set
         :type mask: PrintMode
         """
-        self.print_mode |= mask.value
+        self.print_mode |= mask
         self.write_print_mode()
 
         # Stop if we're not changing the height or width
@@ -410,20 +865,7 @@ class AdafruitThermal(Serial):
                         PrintMode.DOUBLE_WIDTH_MASK):
             return
 
-        if self.print_mode & PrintMode.DOUBLE_HEIGHT_MASK.value:
-            self.char_height = 48
-        else:
-            self.char_height = 24
-        if self.print_mode & PrintMode.DOUBLE_WIDTH_MASK.value:
-            if self.alt_font is False:
-                self.max_column = 16
-            else:
-                self.max_column = 21
-        else:
-            if self.alt_font is False:
-                self.max_column = 32
-            else:
-                self.max_column = 42
+        self._update_geometry()
 
     def unset_print_mode(self, mask: PrintMode) -> None:
         """Unset a print mode.
@@ -432,27 +874,23 @@ class AdafruitThermal(Serial):
         :type mask: PrintMode
         """
 
-        self.print_mode &= ~mask.value
+        self.print_mode &= ~mask
         self.write_print_mode()
-        if self.print_mode & PrintMode.DOUBLE_HEIGHT_MASK.value:
-            self.char_height = 48
-        else:
-            self.char_height = 24
-        if self.print_mode & PrintMode.DOUBLE_WIDTH_MASK.value:
-            if self.alt_font is False:
-                self.max_column = 16
-            else:
-                self.max_column = 21
-        else:
-            if self.alt_font is False:
-                self.max_column = 32
-            else:
-                self.max_column = 42
+        self._update_geometry()
+
+    def _update_geometry(self) -> None:
+        """Update the char height and max columns for the print mode."""
+
+        self.char_height, self.max_column = _GEOMETRY[(
+            bool(self.print_mode & PrintMode.DOUBLE_HEIGHT_MASK),
+            bool(self.print_mode & PrintMode.DOUBLE_WIDTH_MASK),
+            self.alt_font)]
+        self._recompute_line_times()
 
     def write_print_mode(self):
         """Write the current print mode."""
 
-        self.write_bytes(27, 33, self.print_mode)
+        self._send(_PRINT_MODES[self.print_mode])
 
     def inverse(self, mode: bool) -> None:
         """Enables or disables inverse text.
@@ -463,9 +901,9 @@ class AdafruitThermal(Serial):
         """
 
         if mode is True:
-            self.write_bytes(29, 66, 1)
+            self._send(_INVERSE_ON)
         elif mode is False:
-            self.write_bytes(29, 66, 0)
+            self._send(_INVERSE_OFF)
         else:
             raise TypeError("Inverse mode must be True or False.")
 
@@ -569,10 +1007,10 @@ class AdafruitThermal(Serial):
         """
 
         if mode is True:
-            self.write_bytes(27, 86, 1)
+            self._send(_SIDEWAYS_ON)
             self.sideways = True
         elif mode is False:
-            self.write_bytes(27, 86, 0)
+            self._send(_SIDEWAYS_OFF)
             self.sideways = False
         else:
             raise TypeError("Rotate sideways mode must be True or False.")
@@ -608,16 +1046,11 @@ class AdafruitThermal(Serial):
         :raises ValueError: if an invalid justification is given
         """
 
-        if position.upper() == "L":
-            justify = 0
-        elif position.upper() == "C":
-            justify = 1
-        elif position.upper() == "R":
-            justify = 2
-        else:
+        command = _JUSTIFY.get(position.upper())
+        if command is None:
             raise ValueError("Justify position must be L, C, or R.")
 
-        self.write_bytes(0x1B, 0x61, justify)
+        self._send(command)
 
     def feed(self, lines: int = 1) -> None:
         """Feeds by the specified number of lines.
@@ -626,6 +1059,7 @@ class AdafruitThermal(Serial):
         :type lines: int, optional
         """
 
+        self._paper_status = None
         if self.firmware_version >= 264:
             self.write_bytes(27, 100, lines)
             self.timeout_set(self.dot_feed_time * self.char_height)
@@ -635,22 +1069,26 @@ class AdafruitThermal(Serial):
         else:
             # datasheet claims sending bytes 27, 100, <x> works,
             # but it feeds much more than that.  So, manually:
-            while lines > 0:
-                self.write("\n".encode("cp437", "ignore"))
-                lines -= 1
+            if lines > 0:
+                self.write(b"\n" * lines)
 
     def feed_rows(self, rows):
         """Feeds by the specified number of individual pixel rows."""
 
+        self._paper_status = None
         self.write_bytes(27, 74, rows)
         self.timeout_set(rows * self.dot_feed_time)
         self.prev_byte = "\n"
         self.column = 0
 
     def flush(self) -> None:
-        """Flush using ASCII FF."""
+        """Flush using ASCII FF.
+
+        This also sends any data held back in the transmit buffer.
+        """
 
-        self.write_bytes(12)
+        self._send(_FORM_FEED)
+        self._flush_tx()
 
     def set_size(self, size: str) -> None:
         """Set the text size.
@@ -664,31 +1102,18 @@ class AdafruitThermal(Serial):
         :raises ValueError: if an invalid size is given
         """
 
-        if size.upper() == "S":
-            size = 0x00
-            self.char_height = 24
-            if self.alt_font is False:
-                self.max_column = 32
-            else:
-                self.max_column = 42
-        elif size.upper() == "M":
-            size = 0x01
-            self.char_height = 48
-            if self.alt_font is False:
-                self.max_column = 32
-            else:
-                self.max_column = 42
-        elif size.upper() == "L":
-            size = 0x11
-            self.char_height = 48
-            if self.alt_font is False:
-                self.max_column = 16
-            else:
-                self.max_column = 21
-        else:
+        settings = _SIZES.get(size.upper())
+        if settings is None:
             raise ValueError("Text size must be S, M, or L.")
 
-        self.write_bytes(29, 33, size)
+        command, self.char_height, normal_columns, alt_columns = settings
+        if self.alt_font is False:
+            self.max_column = normal_columns
+        else:
+            self.max_column = alt_columns
+        self._recompute_line_times()
+
+        self._send(command)
 
     def underline(self, weight: int) -> None:
         """Set the underline weight.
@@ -704,9 +1129,9 @@ class AdafruitThermal(Serial):
 
         if weight not in (0, 1, 2):
             raise ValueError("Underline weight must be 0, 1, or 2.")
-        self.write_bytes(27, 45, weight)
+        self._send(_UNDERLINE[weight])
 
-    def print_bitmap(self, width: int, height: int, bitmap: bytearray,
+    def print_bitmap(self, width: int, height: int, bitmap: bytes,
                      line_at_a_time: bool = False) -> None:
         """Print a bitmap.
 
@@ -722,18 +1147,35 @@ class AdafruitThermal(Serial):
         :type width: int
         :param height: the height in pixels
         :type height: int
-        :param bitmap: the bitmap to print as a list of (hex) numbers
-        :type bitmap: bytearray
+        :param bitmap: the bitmap to print as bytes (or a list of numbers),
+            one bit per pixel with each row padded to a whole byte
+        :type bitmap: bytes
         :param line_at_a_time: whether to print scanline-at-a-time
         :type line_at_a_time: bool, optional
         """
 
-        row_bytes = math.floor((width + 7) / 8)  # Round up to next byte boundary
+        row_bytes = (width + 7) // 8  # Round up to next byte boundary
         if row_bytes >= 48:
             row_bytes_clipped = 48  # 384 pixels max width
         else:
             row_bytes_clipped = row_bytes
 
+        if row_bytes != row_bytes_clipped:
+            # Drop the bytes beyond 384 pixels from every row up front,
+            # by treating the bitmap as an 8-bit image one pixel per byte
+            # and cropping it in PIL
+            bitmap = Image.frombytes(
+                "L", (row_bytes, height),
+                bytes(bitmap[:row_bytes * height])).crop(
+                (0, 0, row_bytes_clipped, height)).tobytes()
+        else:
+            # Convert lists of numbers once, so each chunk is a plain slice
+            # (bytes, like the bitmaps in gfx, are used as they are)
+            bitmap = bytes(bitmap)
+        # Slice through a view, so each chunk's rows are copied once
+        # when they're joined to its header, rather than once more before
+        bitmap = memoryview(bitmap)
+
         if line_at_a_time:
             max_chunk_height = 1
         else:
@@ -745,21 +1187,21 @@ class AdafruitThermal(Serial):
             if chunk_height > max_chunk_height:
                 chunk_height = max_chunk_height
 
-            # Timeout wait happens here
-            self.write_bytes(18, 42, chunk_height, row_bytes_clipped)
+            # Build the header and chunk for a single write.  This is done
+            # before the timeout wait so it overlaps with the printer still
+            # working on the previous chunk.
+            chunk = (bytes([18, 42, chunk_height, row_bytes_clipped]) +
+                     bitmap[i:i + chunk_height * row_bytes_clipped])
+            i += chunk_height * row_bytes_clipped
 
-            for y in range(chunk_height):
-                for x in range(row_bytes_clipped):
-                    super(AdafruitThermal,
-                          self).write(bytes([bitmap[i]]))
-                    i += 1
-                i += row_bytes - row_bytes_clipped
-            self.timeout_set(chunk_height * self.dot_print_time)
+            # Timeout wait happens here
+            self._send(chunk, chunk_height * self.dot_print_time)
 
         self.prev_byte = "\n"
 
     def print_image_object(self, image: PIL.Image.Image,
-                           line_at_a_time: bool = False) -> None:
+                           line_at_a_time: bool = False,
+                           dither: Optional[str] = None) -> None:
         """Print an image.
 
         Image will be cropped to 384 pixels width if necessary, and
@@ -767,6 +1209,10 @@ class AdafruitThermal(Serial):
         Use the PIL to perform any other behaviour (e.g. scale,
         B&W threshold, etc) before passing the result to this function.
 
+        If dither is "bayer8", an 8x8 ordered dither is used instead of
+        diffusion dithering. This is faster on large images and often
+        looks cleaner on thermal paper.
+
         If line_at_a_time is True, print the image scanline-at-a-time
         (rather than in chunks). This tends to make for much cleaner
         printing (no feed gaps) on large images, but has the opposite
@@ -777,60 +1223,157 @@ class AdafruitThermal(Serial):
         :type image: PIL.Image.Image
         :param line_at_a_time: whether to print scanline-at-a-time
         :type line_at_a_time: bool, optional
+        :param dither: the dithering to use, None or "bayer8"
+        :type dither: Optional[str], optional
+        :raises ValueError: if an invalid dither is given
         """
 
+        if dither not in (None, "bayer8"):
+            raise ValueError("Dither must be None or bayer8.")
+
         if image.mode != "1":
-            image = image.convert("1")
+            if dither == "bayer8":
+                image = _bayer_dither(image)
+            else:
+                image = image.convert("1")
 
         width = image.size[0]
         height = image.size[1]
         if width > 384:
             width = 384
-        row_bytes = math.floor((width + 7) / 8)
-        bitmap = bytearray(row_bytes * height)
-        pixels = image.load()
-
-        for y in range(height):
-            n = y * row_bytes
-            x = 0
-            for b in range(row_bytes):
-                total = 0
-                bit = 128
-                while bit > 0:
-                    if x >= width:
-                        break
-                    if pixels[x, y] == 0:
-                        total |= bit
-                    x += 1
-                    bit >>= 1
-                bitmap[n + b] = total
+
+        # PIL stores 1-bit images packed 8 pixels per byte, MSB first,
+        # with each row padded to a whole byte.  The "1;I" packer inverts
+        # the bits so black pixels are set, as the printer expects.
+        bitmap = image.crop((0, 0, width, height)).tobytes("raw", "1;I")
 
         self.print_bitmap(width, height, bitmap, line_at_a_time)
 
     def print_image_file(self, image_file: Union[str, pathlib.Path, BinaryIO],
-                         line_at_a_time: bool = False) -> None:
+                         line_at_a_time: bool = False,
+                         dither: Optional[str] = None) -> None:
         """Print an image file.
 
         :param image_file: the image file to print
         :type image_file: Union[str, pathlib.Path, BinaryIO]
         :param line_at_a_time: whether to print scanline-at-a-time
         :type line_at_a_time: bool, optional
+        :param dither: the dithering to use, None or "bayer8"
+        :type dither: Optional[str], optional
         """
 
         image = Image.open(image_file)
-        self.print_image_object(image, line_at_a_time)
+        self.print_image_object(image, line_at_a_time, dither)
 
     def print_image(self, image_file: Union[str, pathlib.Path, BinaryIO],
-                    line_at_a_time: bool = False) -> None:
+                    line_at_a_time: bool = False,
+                    dither: Optional[str] = None) -> None:
         """Wrapper of print_image_file() for backwards compatibility.
 
         :param image_file: the image file to print
         :type image_file: Union[str, pathlib.Path, BinaryIO]
         :param line_at_a_time: whether to print scanline-at-a-time
         :type line_at_a_time: bool, optional
+        :param dither: the dithering to use, None or "bayer8"
+        :type dither: Optional[str], optional
+        """
+
+        self.print_image_file(image_file, line_at_a_time, dither)
+
+    def store_nv_bitmaps(self, *bitmaps: Tuple[int, int, bytes]) -> None:
+        """Store bitmaps in the printer's non-volatile (NV) memory.
+
+        Stored bitmaps can then be printed with print_nv_bitmap() by
+        sending just a few bytes, rather than the whole bitmap every time.
+        They're numbered from 1 in the order given, and replace any
+        bitmaps stored before.
+
+        NV memory wears out, so the manual recommends writing it no more
+        than 10 times a day.  Store bitmaps once and reuse them, rather
+        than storing them every time your program runs.
+
+        The printer stops receiving while it writes NV memory, and the
+        manual doesn't say for how long.  Without flow control, this
+        waits for an estimate based on the size of the bitmaps, so if
+        anything sent afterwards goes missing, wait longer before
+        sending it.
+
+        :param bitmaps: the bitmaps to store, each as a tuple of width in
+            pixels, height in pixels, and bitmap in the same format as
+            print_bitmap()
+        :type bitmaps: Tuple[int, int, bytes]
+        :raises ValueError: if there are no bitmaps or they're too large
         """
 
-        self.print_image_file(image_file, line_at_a_time)
+        if not 1 <= len(bitmaps) <= 255:
+            raise ValueError("Must store between 1 and 255 bitmaps.")
+
+        # Each bitmap uses 4 bytes of header and its data
+        size = 0
+        for width, height, _ in bitmaps:
+            x = (width + 7) // 8
+            y = (height + 7) // 8
+            if not (1 <= x <= 1023 and 1 <= y <= 288):
+                raise ValueError("NV bitmaps must be at most 8184x2304.")
+            size += 4 + x * y * 8
+        if size > _NV_BITMAP_MEMORY:
+            raise ValueError("NV bitmaps must total at most 192 KB.")
+
+        command = bytearray([28, 113, len(bitmaps)])  # FS q n
+        for width, height, bitmap in bitmaps:
+            x = (width + 7) // 8
+            y = (height + 7) // 8
+
+            # NV bitmaps are stored column by column, each column as
+            # bytes of 8 vertical dots, so transpose the rows
+            image = Image.new("1", (x * 8, y * 8), 1)
+            image.paste(Image.frombytes(
+                "1", (x * 8, height), bytes(bitmap[:x * height]),
+                "raw", "1;I"))
+            image = image.transpose(Image.Transpose.TRANSPOSE)
+
+            command += bytes([x & 0xFF, x >> 8, y & 0xFF, y >> 8])
+            command += image.tobytes("raw", "1;I")
+
+        # FS q only works at the start of a line
+        if self.column:
+            self.feed_rows(0)
+        self._send(command, 1.0 + len(command) * _NV_WRITE_TIME)
+        self.nv_bitmap_heights = tuple(height for _, height, _ in bitmaps)
+
+    def print_nv_bitmap(self, n: int = 1, mode: int = 0,
+                        height: Optional[int] = None) -> None:
+        """Print a bitmap stored by store_nv_bitmaps().
+
+        Modes are 0 for normal, 1 for double width, 2 for double height
+        and 3 for both.
+
+        :param n: the number of the stored bitmap, from 1
+        :type n: int, optional
+        :param mode: the mode to print the bitmap in
+        :type mode: int, optional
+        :param height: the height of the bitmap in pixels, only needed
+            if it wasn't stored by this instance
+        :type height: Optional[int], optional
+        :raises ValueError: if the mode is invalid or the height is unknown
+        """
+
+        if mode not in (0, 1, 2, 3):
+            raise ValueError("NV bitmap mode must be 0, 1, 2, or 3.")
+        if height is None:
+            if not 1 <= n <= len(self.nv_bitmap_heights):
+                raise ValueError("The height of NV bitmap %d is unknown." % n)
+            height = self.nv_bitmap_heights[n - 1]
+        if mode & 2:
+            height *= 2
+
+        # FS p only works when there's nothing in the print buffer
+        if self.column:
+            self.feed_rows(0)
+        self._send(bytes([28, 112, n, mode]),  # FS p n m
+                   height * self.dot_print_time)
+        self.prev_byte = "\n"
+        self.column = 0
 
     def offline(self) -> None:
         """Take the printer offline.
@@ -838,11 +1381,11 @@ class AdafruitThermal(Serial):
         Print commands sent after this will be ignored until online() is called.
         """
 
-        self.write_bytes(27, 61, 0)
+        self._send(_OFFLINE)
 
     def online(self) -> None:
         """Take the printer online. Subsequent print commands will be obeyed."""
-        self.write_bytes(27, 61, 1)
+        self._send(_ONLINE)
 
     def sleep(self, seconds: int = 1) -> None:
         """Put the printer into a low-energy state.
@@ -851,17 +1394,21 @@ class AdafruitThermal(Serial):
         :type seconds: int, optional
         """
 
+        self._paper_status = None
         if self.firmware_version >= 264:
             self.write_bytes(27, 56, seconds & 0xFF, seconds >> 8)
         else:
             self.write_bytes(27, 56, seconds)
+        self._flush_tx()
 
     def wake(self) -> None:
         """Take the printer out of the low-energy state."""
 
+        self._paper_status = None
         self.timeout_set(0)
         self.write_bytes(255)
         if self.firmware_version >= 264:
+            self._flush_tx()
             time.sleep(0.05)  # 50 ms
             self.write_bytes(27, 118, 0)  # Sleep off (important!)
         else:
@@ -875,21 +1422,32 @@ class AdafruitThermal(Serial):
         This uses the printer's self-reporting ability.
         It doesn't match the datasheet
 
+        The result is reused for 100 ms, or until the paper is fed, so
+        checking it repeatedly doesn't wait for the printer every time.
+
         :return: True if paper present, False for no paper
         """
 
+        if self._paper_status is not None:
+            checked, status = self._paper_status
+            if time.monotonic() - checked < _PAPER_STATUS_TTL:
+                return status
+
         self.flush()
         if self.firmware_version >= 264:
             self.write_bytes(27, 118, 0)
         else:
             self.write_bytes(29, 114, 0)
+        self._flush_tx()
         # Bit 2 of response seems to be paper status
         result = self.read(1)
+        status = True
         if len(result) > 0:
             stat = ord(result) & 0b00000100
             # If set, no paper; if clear, we have paper
-            return stat != 0
-        return True
+            status = stat != 0
+        self._paper_status = (time.monotonic(), status)
+        return status
 
     def set_line_height(self, val: int = 32) -> None:
         """Sets the line spacing.
@@ -907,6 +1465,7 @@ class AdafruitThermal(Serial):
         if val < 24:
             val = 24
         self.line_spacing = val - 24
+        self._recompute_line_times()
         self.write_bytes(27, 51, val)
 
     def set_charset(self, charset: Charset = Charset.CHARSET_UK) -> None:
@@ -918,7 +1477,7 @@ class AdafruitThermal(Serial):
         :type charset: Charset
         """
 
-        self.write_bytes(27, 82, charset.value)
+        self.write_bytes(27, 82, charset)
 
     def set_code_page(self,
                       codepage: Codepage = Codepage.CODEPAGE_CP437) -> None:
@@ -928,7 +1487,7 @@ class AdafruitThermal(Serial):
         :type codepage: Codepage
         """
 
-        self.write_bytes(27, 116, codepage.value)
+        self.write_bytes(27, 116, codepage)
 
     def println(self, text: Any, wrap: bool = False, newline: bool = True) -> None:
         """Print the text.
@@ -941,13 +1500,27 @@ class AdafruitThermal(Serial):
         :type newline: bool, optional
         """
 
+        if not isinstance(text, str):
+            text = str(text)
+        if wrap is True and self.sideways is not True:
+            # Short single lines are left as they are, as wrapping
+            # wouldn't change them
+            if (len(text) > self.max_column or not text.isprintable() or
+                    text.endswith(" ")):
+                if text[-1] == " ":
+                    text = textwrap.fill(text, self.max_column, replace_whitespace=True) + " "
+                else:
+                    text = textwrap.fill(text, self.max_column, replace_whitespace=True)
+
+        # Most text is plain ASCII, which doesn't need the cp437 codec
+        if text.isascii():
+            data = text.encode("ascii")
+        else:
+            data = _encode_cp437(text, "ignore")[0]
+        # cp437 is one byte per character, so the bytes can be reversed
+        # instead of the text
         if self.sideways is True:
-            text = str(text)[::-1]
-        elif wrap is True:
-            if text[-1] == " ":
-                text = textwrap.fill(str(text), self.max_column, replace_whitespace=True) + " "
-            else:
-                text = textwrap.fill(str(text), self.max_column, replace_whitespace=True)
-        self.write((str(text)).encode("cp437", "ignore"))
+            data = data[::-1]
         if newline is True:
-            self.write("\n".encode("cp437", "ignore"))
+            data += b"\n"
+        self.write(data)
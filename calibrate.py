@@ -22,19 +22,31 @@
 
 from __future__ import print_function
 
+import argparse
+
 from adafruit_thermal import AdafruitThermal
 from enums import Barcode
 
-printer = AdafruitThermal("/dev/serial0", 9600)
+parser = argparse.ArgumentParser(
+    description="Print heat time calibration bars on the thermal printer.")
+parser.add_argument("--port", default="/dev/serial0",
+                    help="the serial port, e.g. /dev/ttyUSB0 for USB")
+parser.add_argument("--baud", type=int, default=9600,
+                    help="the baud rate, from the self-test page")
+args = parser.parse_args()
+
+printer = AdafruitThermal(args.port, args.baud)
 
 for i in range(0, 256, 15):
-    printer.set_heat_time(i)
-    printer.println(i)  # Print heat time
-    printer.set_barcode_height(20)
-    printer.print_barcode("ABCDEFGH", Barcode.CODE128)
-    # printer.inverse(True)
-    # printer.println("                              ", False, False)  # Print 32 spaces (inverted)
-    # printer.inverse(False)
+    # Send each step in a single write
+    with printer.batch():
+        printer.set_heat_time(i)
+        printer.println(i)  # Print heat time
+        printer.set_barcode_height(20)
+        printer.print_barcode("ABCDEFGH", Barcode.CODE128)
+        # printer.inverse(True)
+        # printer.println("                              ", False, False)  # Print 32 spaces (inverted)
+        # printer.inverse(False)
 
 printer.set_heat_time()  # Reset heat time to default
 printer.feed(4)
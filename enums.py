@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import IntEnum, IntFlag
 
 
-class Barcode(Enum):
+class Barcode(IntEnum):
     UPC_A = 0
     UPC_E = 1
     EAN13 = 2
@@ -17,7 +17,7 @@ class Barcode(Enum):
     CODABAR = 12
 
 
-class Charset(Enum):
+class Charset(IntEnum):
     CHARSET_USA = 0
     CHARSET_FRANCE = 1
     CHARSET_GERMANY = 2
@@ -37,7 +37,7 @@ class Charset(Enum):
     CHARSET_CHINA = 15
 
 
-class Codepage(Enum):
+class Codepage(IntEnum):
     CODEPAGE_CP437 = 0  # USA, Standard Europe
     CODEPAGE_KATAKANA = 1
     CODEPAGE_CP850 = 2  # Multilingual
@@ -84,7 +84,7 @@ class Codepage(Enum):
     CODEPAGE_CP874 = 47
 
 
-class PrintMode(Enum):
+class PrintMode(IntFlag):
     SMALL_FONT_MASK = (1 << 0)
     UPDOWN_MASK = (1 << 2)
     BOLD_MASK = (1 << 3)
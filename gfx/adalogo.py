@@ -1,79 +1,79 @@
 width = 75
 height = 75
-data = [
-    0x00, 0x00, 0x00, 0x00, 0x00, 0xe0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x03, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x03, 0xf8, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x07, 0xf8, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x0f, 0xf8, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x1f, 0xfc, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x1f, 0xfc, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x3f, 0xfc, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x7f, 0xfe, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x7f, 0xfe, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0xff, 0xfe, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x01, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x03, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x03, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x07, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x07, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x07, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x7f, 0xff, 0xfc, 0x0f, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0xff, 0xff, 0xff, 0x0f, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0xff, 0xff, 0xff, 0xcf, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0xff, 0xff, 0xff, 0xef, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x7f, 0xff, 0xff, 0xf7, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00,
-    0x3f, 0xff, 0xff, 0xff, 0xfb, 0xff, 0x00, 0x00, 0x00, 0x00,
-    0x3f, 0xff, 0xff, 0xff, 0xf1, 0xff, 0x3f, 0xf0, 0x00, 0x00,
-    0x1f, 0xff, 0xff, 0xff, 0xf1, 0xfe, 0xff, 0xfe, 0x00, 0x00,
-    0x0f, 0xff, 0xff, 0xff, 0xf1, 0xff, 0xff, 0xff, 0xc0, 0x00,
-    0x0f, 0xff, 0xff, 0xff, 0xe1, 0xff, 0xff, 0xff, 0xf8, 0x00,
-    0x07, 0xff, 0xff, 0xff, 0xe1, 0xff, 0xff, 0xff, 0xff, 0x00,
-    0x03, 0xff, 0xff, 0xff, 0xe1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x01, 0xff, 0xff, 0x3f, 0xe1, 0xff, 0xff, 0xff, 0xff, 0xe0,
-    0x01, 0xff, 0xfe, 0x07, 0xe3, 0xff, 0xff, 0xff, 0xff, 0xe0,
-    0x00, 0xff, 0xff, 0x03, 0xe3, 0xff, 0xff, 0xff, 0xff, 0xe0,
-    0x00, 0x7f, 0xff, 0x00, 0xf7, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x00, 0x3f, 0xff, 0xc0, 0xff, 0xc0, 0x7f, 0xff, 0xff, 0x80,
-    0x00, 0x1f, 0xff, 0xf0, 0xff, 0x00, 0x3f, 0xff, 0xff, 0x00,
-    0x00, 0x0f, 0xff, 0xff, 0xff, 0x00, 0x7f, 0xff, 0xfc, 0x00,
-    0x00, 0x07, 0xff, 0xff, 0xff, 0x01, 0xff, 0xff, 0xf8, 0x00,
-    0x00, 0x01, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xf0, 0x00,
-    0x00, 0x00, 0x7f, 0xff, 0xff, 0xff, 0xff, 0xff, 0xc0, 0x00,
-    0x00, 0x00, 0x1f, 0xfc, 0x7f, 0xff, 0xff, 0xff, 0x80, 0x00,
-    0x00, 0x00, 0x7f, 0xf8, 0x78, 0xff, 0xff, 0xfe, 0x00, 0x00,
-    0x00, 0x00, 0xff, 0xf0, 0x78, 0x7f, 0xff, 0xfc, 0x00, 0x00,
-    0x00, 0x01, 0xff, 0xe0, 0xf8, 0x7f, 0xff, 0xf0, 0x00, 0x00,
-    0x00, 0x03, 0xff, 0xc0, 0xf8, 0x3f, 0xdf, 0xc0, 0x00, 0x00,
-    0x00, 0x07, 0xff, 0xc1, 0xfc, 0x3f, 0xe0, 0x00, 0x00, 0x00,
-    0x00, 0x07, 0xff, 0x87, 0xfc, 0x1f, 0xf0, 0x00, 0x00, 0x00,
-    0x00, 0x0f, 0xff, 0xcf, 0xfe, 0x1f, 0xf8, 0x00, 0x00, 0x00,
-    0x00, 0x0f, 0xff, 0xff, 0xff, 0x1f, 0xf8, 0x00, 0x00, 0x00,
-    0x00, 0x1f, 0xff, 0xff, 0xff, 0x1f, 0xfc, 0x00, 0x00, 0x00,
-    0x00, 0x1f, 0xff, 0xff, 0xff, 0xff, 0xfc, 0x00, 0x00, 0x00,
-    0x00, 0x1f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x3f, 0xff, 0xff, 0x3f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x7f, 0xff, 0xff, 0x3f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x7f, 0xff, 0xff, 0x3f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x7f, 0xff, 0xfe, 0x3f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0xff, 0xff, 0xfc, 0x1f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0xff, 0xff, 0xf8, 0x1f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0xff, 0xff, 0xe0, 0x0f, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x01, 0xff, 0xff, 0x80, 0x07, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x01, 0xff, 0xfc, 0x00, 0x03, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x01, 0xff, 0xe0, 0x00, 0x01, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x01, 0xff, 0x00, 0x00, 0x00, 0xff, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0xf8, 0x00, 0x00, 0x00, 0x7f, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x1f, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x0f, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xfe, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7e, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00
-]
+data = (
+    b"\x00\x00\x00\x00\x00\xe0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x01\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x03\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x03\xf8\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x07\xf8\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x0f\xf8\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x1f\xfc\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x1f\xfc\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x3f\xfc\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x7f\xfe\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x7f\xfe\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\xff\xfe\x00\x00\x00\x00"
+    b"\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00"
+    b"\x00\x00\x00\x03\xff\xff\x00\x00\x00\x00"
+    b"\x00\x00\x00\x03\xff\xff\x00\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\x80\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\x80\x00\x00\x00"
+    b"\x00\x00\x00\x07\xff\xff\x80\x00\x00\x00"
+    b"\x00\x00\x00\x0f\xff\xff\x80\x00\x00\x00"
+    b"\x00\x00\x00\x0f\xff\xff\x80\x00\x00\x00"
+    b"\x7f\xff\xfc\x0f\xff\xff\x80\x00\x00\x00"
+    b"\xff\xff\xff\x0f\xff\xff\x80\x00\x00\x00"
+    b"\xff\xff\xff\xcf\xff\xff\x80\x00\x00\x00"
+    b"\xff\xff\xff\xef\xff\xff\x80\x00\x00\x00"
+    b"\x7f\xff\xff\xf7\xff\xff\x80\x00\x00\x00"
+    b"\x3f\xff\xff\xff\xfb\xff\x00\x00\x00\x00"
+    b"\x3f\xff\xff\xff\xf1\xff\x3f\xf0\x00\x00"
+    b"\x1f\xff\xff\xff\xf1\xfe\xff\xfe\x00\x00"
+    b"\x0f\xff\xff\xff\xf1\xff\xff\xff\xc0\x00"
+    b"\x0f\xff\xff\xff\xe1\xff\xff\xff\xf8\x00"
+    b"\x07\xff\xff\xff\xe1\xff\xff\xff\xff\x00"
+    b"\x03\xff\xff\xff\xe1\xff\xff\xff\xff\xc0"
+    b"\x01\xff\xff\x3f\xe1\xff\xff\xff\xff\xe0"
+    b"\x01\xff\xfe\x07\xe3\xff\xff\xff\xff\xe0"
+    b"\x00\xff\xff\x03\xe3\xff\xff\xff\xff\xe0"
+    b"\x00\x7f\xff\x00\xf7\xff\xff\xff\xff\xc0"
+    b"\x00\x3f\xff\xc0\xff\xc0\x7f\xff\xff\x80"
+    b"\x00\x1f\xff\xf0\xff\x00\x3f\xff\xff\x00"
+    b"\x00\x0f\xff\xff\xff\x00\x7f\xff\xfc\x00"
+    b"\x00\x07\xff\xff\xff\x01\xff\xff\xf8\x00"
+    b"\x00\x01\xff\xff\xff\xff\xff\xff\xf0\x00"
+    b"\x00\x00\x7f\xff\xff\xff\xff\xff\xc0\x00"
+    b"\x00\x00\x1f\xfc\x7f\xff\xff\xff\x80\x00"
+    b"\x00\x00\x7f\xf8\x78\xff\xff\xfe\x00\x00"
+    b"\x00\x00\xff\xf0\x78\x7f\xff\xfc\x00\x00"
+    b"\x00\x01\xff\xe0\xf8\x7f\xff\xf0\x00\x00"
+    b"\x00\x03\xff\xc0\xf8\x3f\xdf\xc0\x00\x00"
+    b"\x00\x07\xff\xc1\xfc\x3f\xe0\x00\x00\x00"
+    b"\x00\x07\xff\x87\xfc\x1f\xf0\x00\x00\x00"
+    b"\x00\x0f\xff\xcf\xfe\x1f\xf8\x00\x00\x00"
+    b"\x00\x0f\xff\xff\xff\x1f\xf8\x00\x00\x00"
+    b"\x00\x1f\xff\xff\xff\x1f\xfc\x00\x00\x00"
+    b"\x00\x1f\xff\xff\xff\xff\xfc\x00\x00\x00"
+    b"\x00\x1f\xff\xff\xff\xff\xfe\x00\x00\x00"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x00\x00\x00"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x00\x00\x00"
+    b"\x00\x3f\xff\xff\x3f\xff\xfe\x00\x00\x00"
+    b"\x00\x7f\xff\xff\x3f\xff\xfe\x00\x00\x00"
+    b"\x00\x7f\xff\xff\x3f\xff\xfe\x00\x00\x00"
+    b"\x00\x7f\xff\xfe\x3f\xff\xfe\x00\x00\x00"
+    b"\x00\xff\xff\xfc\x1f\xff\xfe\x00\x00\x00"
+    b"\x00\xff\xff\xf8\x1f\xff\xfe\x00\x00\x00"
+    b"\x00\xff\xff\xe0\x0f\xff\xfe\x00\x00\x00"
+    b"\x01\xff\xff\x80\x07\xff\xfe\x00\x00\x00"
+    b"\x01\xff\xfc\x00\x03\xff\xfe\x00\x00\x00"
+    b"\x01\xff\xe0\x00\x01\xff\xfe\x00\x00\x00"
+    b"\x01\xff\x00\x00\x00\xff\xfe\x00\x00\x00"
+    b"\x00\xf8\x00\x00\x00\x7f\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x1f\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x0f\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x01\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\xfe\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x7e\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x1c\x00\x00\x00"
+)
@@ -1,139 +1,139 @@
 width = 135
 height = 135
-data = [
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0xff, 0xf8, 0x01, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0xff, 0xf8, 0x01, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0xff, 0xf8, 0x01, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0xff, 0xf8, 0x01, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x01, 0xff, 0xff, 0xff, 0xf8, 0x01, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0xf8, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0xf8, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0xf8, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0xf8, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0xf8, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3e, 0x0f, 0xff, 0xe0, 0x00, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3e, 0x0f, 0xff, 0xe0, 0x00, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3e, 0x0f, 0xff, 0xe0, 0x00, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3e, 0x0f, 0xff, 0xe0, 0x00, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3e, 0x0f, 0xff, 0xe0, 0x00, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x00, 0xf8, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x00, 0xf8, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x00, 0xf8, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x00, 0xf8, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x00, 0xf8, 0x01, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x7c, 0x00, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x7c, 0x00, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x7c, 0x00, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x7c, 0x00, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x7c, 0x00, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7f, 0xff, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7f, 0xff, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7f, 0xff, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7f, 0xff, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7f, 0xff, 0x00, 0x01, 0xf0, 0x00, 0x00, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x07, 0xc1, 0xf0, 0x7c, 0x1f, 0x07, 0xc1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x07, 0xc1, 0xf0, 0x7c, 0x1f, 0x07, 0xc1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x07, 0xc1, 0xf0, 0x7c, 0x1f, 0x07, 0xc1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x07, 0xc1, 0xf0, 0x7c, 0x1f, 0x07, 0xc1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x07, 0xc1, 0xf0, 0x7c, 0x1f, 0x07, 0xc1, 0xff, 0xff, 0xff, 0xff, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xc1, 0xf0, 0x03, 0xe0, 0x07, 0xc0, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xc1, 0xf0, 0x03, 0xe0, 0x07, 0xc0, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xc1, 0xf0, 0x03, 0xe0, 0x07, 0xc0, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xc1, 0xf0, 0x03, 0xe0, 0x07, 0xc0, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xc1, 0xf0, 0x03, 0xe0, 0x07, 0xc0, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x3f, 0xf0, 0x00, 0x1f, 0x00, 0x01, 0xf0, 0x03, 0xe0, 0xf8, 0x01, 0xff, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3f, 0xf0, 0x00, 0x1f, 0x00, 0x01, 0xf0, 0x03, 0xe0, 0xf8, 0x01, 0xff, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3f, 0xf0, 0x00, 0x1f, 0x00, 0x01, 0xf0, 0x03, 0xe0, 0xf8, 0x01, 0xff, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3f, 0xf0, 0x00, 0x1f, 0x00, 0x01, 0xf0, 0x03, 0xe0, 0xf8, 0x01, 0xff, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3f, 0xf0, 0x00, 0x1f, 0x00, 0x01, 0xf0, 0x03, 0xe0, 0xf8, 0x01, 0xff, 0x83, 0xe0, 0x00, 0x00,
-    0x07, 0xc1, 0xf0, 0x00, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x00, 0xff, 0xc1, 0xff, 0x83, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xf0, 0x00, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x00, 0xff, 0xc1, 0xff, 0x83, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xf0, 0x00, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x00, 0xff, 0xc1, 0xff, 0x83, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xf0, 0x00, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x00, 0xff, 0xc1, 0xff, 0x83, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xf0, 0x00, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x00, 0xff, 0xc1, 0xff, 0x83, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xf0, 0x03, 0xff, 0x07, 0xc1, 0xf0, 0x7f, 0xff, 0xf8, 0x3f, 0xff, 0xff, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xf0, 0x03, 0xff, 0x07, 0xc1, 0xf0, 0x7f, 0xff, 0xf8, 0x3f, 0xff, 0xff, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xf0, 0x03, 0xff, 0x07, 0xc1, 0xf0, 0x7f, 0xff, 0xf8, 0x3f, 0xff, 0xff, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xf0, 0x03, 0xff, 0x07, 0xc1, 0xf0, 0x7f, 0xff, 0xf8, 0x3f, 0xff, 0xff, 0xff, 0x07, 0xc0,
-    0x07, 0xc1, 0xf0, 0x03, 0xff, 0x07, 0xc1, 0xf0, 0x7f, 0xff, 0xf8, 0x3f, 0xff, 0xff, 0xff, 0x07, 0xc0,
-    0x00, 0x3e, 0x0f, 0xfc, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x1f, 0x00, 0x3e, 0x0f, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3e, 0x0f, 0xfc, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x1f, 0x00, 0x3e, 0x0f, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3e, 0x0f, 0xfc, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x1f, 0x00, 0x3e, 0x0f, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3e, 0x0f, 0xfc, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x1f, 0x00, 0x3e, 0x0f, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3e, 0x0f, 0xfc, 0x00, 0xf8, 0x3e, 0x00, 0x7c, 0x1f, 0x00, 0x3e, 0x0f, 0x83, 0xe0, 0x00, 0x00,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc1, 0xff, 0x80, 0x00, 0x07, 0xc0,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc1, 0xff, 0x80, 0x00, 0x07, 0xc0,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc1, 0xff, 0x80, 0x00, 0x07, 0xc0,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc1, 0xff, 0x80, 0x00, 0x07, 0xc0,
-    0x00, 0x3f, 0xff, 0xff, 0xff, 0xff, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc1, 0xff, 0x80, 0x00, 0x07, 0xc0,
-    0x00, 0x3e, 0x00, 0x03, 0xe0, 0x07, 0xfe, 0x00, 0x00, 0x1f, 0xff, 0xc1, 0xff, 0x80, 0x00, 0xff, 0xc0,
-    0x00, 0x3e, 0x00, 0x03, 0xe0, 0x07, 0xfe, 0x00, 0x00, 0x1f, 0xff, 0xc1, 0xff, 0x80, 0x00, 0xff, 0xc0,
-    0x00, 0x3e, 0x00, 0x03, 0xe0, 0x07, 0xfe, 0x00, 0x00, 0x1f, 0xff, 0xc1, 0xff, 0x80, 0x00, 0xff, 0xc0,
-    0x00, 0x3e, 0x00, 0x03, 0xe0, 0x07, 0xfe, 0x00, 0x00, 0x1f, 0xff, 0xc1, 0xff, 0x80, 0x00, 0xff, 0xc0,
-    0x00, 0x3e, 0x00, 0x03, 0xe0, 0x07, 0xfe, 0x00, 0x00, 0x1f, 0xff, 0xc1, 0xff, 0x80, 0x00, 0xff, 0xc0,
-    0x07, 0xfe, 0x00, 0x7c, 0x1f, 0xf8, 0x3e, 0x0f, 0x83, 0xff, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xfe, 0x00, 0x7c, 0x1f, 0xf8, 0x3e, 0x0f, 0x83, 0xff, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xfe, 0x00, 0x7c, 0x1f, 0xf8, 0x3e, 0x0f, 0x83, 0xff, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xfe, 0x00, 0x7c, 0x1f, 0xf8, 0x3e, 0x0f, 0x83, 0xff, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x07, 0xfe, 0x00, 0x7c, 0x1f, 0xf8, 0x3e, 0x0f, 0x83, 0xff, 0xff, 0xc1, 0xf0, 0x7f, 0xff, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x7f, 0xe0, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0xff, 0xc1, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x7f, 0xe0, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0xff, 0xc1, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x7f, 0xe0, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0xff, 0xc1, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x7f, 0xe0, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0xff, 0xc1, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x7f, 0xe0, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0xff, 0xc1, 0xf0, 0x00, 0x00, 0x00, 0x00,
-    0x07, 0xfe, 0x0f, 0x80, 0x1f, 0xff, 0xff, 0xf0, 0x03, 0xff, 0x07, 0xff, 0xff, 0xfc, 0x00, 0xf8, 0x00,
-    0x07, 0xfe, 0x0f, 0x80, 0x1f, 0xff, 0xff, 0xf0, 0x03, 0xff, 0x07, 0xff, 0xff, 0xfc, 0x00, 0xf8, 0x00,
-    0x07, 0xfe, 0x0f, 0x80, 0x1f, 0xff, 0xff, 0xf0, 0x03, 0xff, 0x07, 0xff, 0xff, 0xfc, 0x00, 0xf8, 0x00,
-    0x07, 0xfe, 0x0f, 0x80, 0x1f, 0xff, 0xff, 0xf0, 0x03, 0xff, 0x07, 0xff, 0xff, 0xfc, 0x00, 0xf8, 0x00,
-    0x07, 0xfe, 0x0f, 0x80, 0x1f, 0xff, 0xff, 0xf0, 0x03, 0xff, 0x07, 0xff, 0xff, 0xfc, 0x00, 0xf8, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc0, 0x00, 0x7c, 0x1f, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc0, 0x00, 0x7c, 0x1f, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc0, 0x00, 0x7c, 0x1f, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc0, 0x00, 0x7c, 0x1f, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xfe, 0x0f, 0x83, 0xff, 0x07, 0xc0, 0x00, 0x7c, 0x1f, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0x07, 0xc1, 0xf0, 0x7f, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0x07, 0xc1, 0xf0, 0x7f, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0x07, 0xc1, 0xf0, 0x7f, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0x07, 0xc1, 0xf0, 0x7f, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x3e, 0x00, 0x7f, 0xe0, 0x07, 0xc1, 0xf0, 0x7f, 0xe0, 0x07, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x00, 0x3f, 0xff, 0x80, 0x00, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0x00, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xff, 0xff, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xff, 0xff, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xff, 0xff, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xff, 0xff, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x3f, 0xf0, 0x03, 0xff, 0xff, 0xff, 0xff, 0xff, 0xe0, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x00, 0x0f, 0x80, 0x00, 0xf8, 0x3e, 0x00, 0x7f, 0xff, 0xf8, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x00, 0x0f, 0x80, 0x00, 0xf8, 0x3e, 0x00, 0x7f, 0xff, 0xf8, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x00, 0x0f, 0x80, 0x00, 0xf8, 0x3e, 0x00, 0x7f, 0xff, 0xf8, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x00, 0x0f, 0x80, 0x00, 0xf8, 0x3e, 0x00, 0x7f, 0xff, 0xf8, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x00, 0x00, 0x0f, 0x80, 0x00, 0xf8, 0x3e, 0x00, 0x7f, 0xff, 0xf8, 0x00,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xc0, 0x0f, 0xfc, 0x1f, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xc0, 0x0f, 0xfc, 0x1f, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xc0, 0x0f, 0xfc, 0x1f, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xc0, 0x0f, 0xfc, 0x1f, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0xff, 0xc0,
-    0x07, 0xc1, 0xff, 0xfc, 0x1f, 0x07, 0xc0, 0x0f, 0xfc, 0x1f, 0x07, 0xc0, 0x00, 0x7c, 0x00, 0xff, 0xc0,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x1f, 0xff, 0xc0, 0x0f, 0xfc, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x1f, 0xff, 0xc0, 0x0f, 0xfc, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x1f, 0xff, 0xc0, 0x0f, 0xfc, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x1f, 0xff, 0xc0, 0x0f, 0xfc, 0x00, 0x00, 0x00,
-    0x07, 0xc0, 0x00, 0x00, 0x1f, 0x07, 0xff, 0xf0, 0x7c, 0x1f, 0xff, 0xc0, 0x0f, 0xfc, 0x00, 0x00, 0x00,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x07, 0xfe, 0x00, 0x03, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x07, 0xfe, 0x00, 0x03, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x07, 0xfe, 0x00, 0x03, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x07, 0xfe, 0x00, 0x03, 0xe0, 0x07, 0xc0,
-    0x07, 0xff, 0xff, 0xff, 0xff, 0x00, 0x00, 0x0f, 0xff, 0xff, 0x07, 0xfe, 0x00, 0x03, 0xe0, 0x07, 0xc0,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-]
+data = (
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x07\xff\xff\xff\xff\x00\x01\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x01\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x01\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x01\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x01\xff\xff\xff\xf8\x01\xff\xff\xff\xff\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\xf8\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\xf8\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\xf8\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\xf8\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\xf8\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3e\x0f\xff\xe0\x00\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3e\x0f\xff\xe0\x00\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3e\x0f\xff\xe0\x00\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3e\x0f\xff\xe0\x00\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3e\x0f\xff\xe0\x00\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xff\xf0\x7c\x00\xf8\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xff\xf0\x7c\x00\xf8\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xff\xf0\x7c\x00\xf8\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xff\xf0\x7c\x00\xf8\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xff\xf0\x7c\x00\xf8\x01\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x7c\x00\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x7c\x00\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x7c\x00\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x7c\x00\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x7c\x00\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7f\xff\x00\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7f\xff\x00\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7f\xff\x00\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7f\xff\x00\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7f\xff\x00\x01\xf0\x00\x00\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x07\xc1\xf0\x7c\x1f\x07\xc1\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x07\xc1\xf0\x7c\x1f\x07\xc1\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x07\xc1\xf0\x7c\x1f\x07\xc1\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x07\xc1\xf0\x7c\x1f\x07\xc1\xff\xff\xff\xff\xc0"
+    b"\x07\xff\xff\xff\xff\x07\xc1\xf0\x7c\x1f\x07\xc1\xff\xff\xff\xff\xc0"
+    b"\x00\x00\x00\x00\x00\x07\xc1\xf0\x03\xe0\x07\xc0\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x07\xc1\xf0\x03\xe0\x07\xc0\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x07\xc1\xf0\x03\xe0\x07\xc0\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x07\xc1\xf0\x03\xe0\x07\xc0\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x07\xc1\xf0\x03\xe0\x07\xc0\x00\x00\x00\x00\x00"
+    b"\x00\x3f\xf0\x00\x1f\x00\x01\xf0\x03\xe0\xf8\x01\xff\x83\xe0\x00\x00"
+    b"\x00\x3f\xf0\x00\x1f\x00\x01\xf0\x03\xe0\xf8\x01\xff\x83\xe0\x00\x00"
+    b"\x00\x3f\xf0\x00\x1f\x00\x01\xf0\x03\xe0\xf8\x01\xff\x83\xe0\x00\x00"
+    b"\x00\x3f\xf0\x00\x1f\x00\x01\xf0\x03\xe0\xf8\x01\xff\x83\xe0\x00\x00"
+    b"\x00\x3f\xf0\x00\x1f\x00\x01\xf0\x03\xe0\xf8\x01\xff\x83\xe0\x00\x00"
+    b"\x07\xc1\xf0\x00\x00\xf8\x3e\x00\x7c\x00\xff\xc1\xff\x83\xe0\xff\xc0"
+    b"\x07\xc1\xf0\x00\x00\xf8\x3e\x00\x7c\x00\xff\xc1\xff\x83\xe0\xff\xc0"
+    b"\x07\xc1\xf0\x00\x00\xf8\x3e\x00\x7c\x00\xff\xc1\xff\x83\xe0\xff\xc0"
+    b"\x07\xc1\xf0\x00\x00\xf8\x3e\x00\x7c\x00\xff\xc1\xff\x83\xe0\xff\xc0"
+    b"\x07\xc1\xf0\x00\x00\xf8\x3e\x00\x7c\x00\xff\xc1\xff\x83\xe0\xff\xc0"
+    b"\x07\xc1\xf0\x03\xff\x07\xc1\xf0\x7f\xff\xf8\x3f\xff\xff\xff\x07\xc0"
+    b"\x07\xc1\xf0\x03\xff\x07\xc1\xf0\x7f\xff\xf8\x3f\xff\xff\xff\x07\xc0"
+    b"\x07\xc1\xf0\x03\xff\x07\xc1\xf0\x7f\xff\xf8\x3f\xff\xff\xff\x07\xc0"
+    b"\x07\xc1\xf0\x03\xff\x07\xc1\xf0\x7f\xff\xf8\x3f\xff\xff\xff\x07\xc0"
+    b"\x07\xc1\xf0\x03\xff\x07\xc1\xf0\x7f\xff\xf8\x3f\xff\xff\xff\x07\xc0"
+    b"\x00\x3e\x0f\xfc\x00\xf8\x3e\x00\x7c\x1f\x00\x3e\x0f\x83\xe0\x00\x00"
+    b"\x00\x3e\x0f\xfc\x00\xf8\x3e\x00\x7c\x1f\x00\x3e\x0f\x83\xe0\x00\x00"
+    b"\x00\x3e\x0f\xfc\x00\xf8\x3e\x00\x7c\x1f\x00\x3e\x0f\x83\xe0\x00\x00"
+    b"\x00\x3e\x0f\xfc\x00\xf8\x3e\x00\x7c\x1f\x00\x3e\x0f\x83\xe0\x00\x00"
+    b"\x00\x3e\x0f\xfc\x00\xf8\x3e\x00\x7c\x1f\x00\x3e\x0f\x83\xe0\x00\x00"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x0f\x83\xff\x07\xc1\xff\x80\x00\x07\xc0"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x0f\x83\xff\x07\xc1\xff\x80\x00\x07\xc0"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x0f\x83\xff\x07\xc1\xff\x80\x00\x07\xc0"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x0f\x83\xff\x07\xc1\xff\x80\x00\x07\xc0"
+    b"\x00\x3f\xff\xff\xff\xff\xfe\x0f\x83\xff\x07\xc1\xff\x80\x00\x07\xc0"
+    b"\x00\x3e\x00\x03\xe0\x07\xfe\x00\x00\x1f\xff\xc1\xff\x80\x00\xff\xc0"
+    b"\x00\x3e\x00\x03\xe0\x07\xfe\x00\x00\x1f\xff\xc1\xff\x80\x00\xff\xc0"
+    b"\x00\x3e\x00\x03\xe0\x07\xfe\x00\x00\x1f\xff\xc1\xff\x80\x00\xff\xc0"
+    b"\x00\x3e\x00\x03\xe0\x07\xfe\x00\x00\x1f\xff\xc1\xff\x80\x00\xff\xc0"
+    b"\x00\x3e\x00\x03\xe0\x07\xfe\x00\x00\x1f\xff\xc1\xff\x80\x00\xff\xc0"
+    b"\x07\xfe\x00\x7c\x1f\xf8\x3e\x0f\x83\xff\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xfe\x00\x7c\x1f\xf8\x3e\x0f\x83\xff\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xfe\x00\x7c\x1f\xf8\x3e\x0f\x83\xff\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xfe\x00\x7c\x1f\xf8\x3e\x0f\x83\xff\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x07\xfe\x00\x7c\x1f\xf8\x3e\x0f\x83\xff\xff\xc1\xf0\x7f\xff\x07\xc0"
+    b"\x00\x00\x00\x7f\xe0\x00\x3e\x00\x7f\xe0\xff\xc1\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x7f\xe0\x00\x3e\x00\x7f\xe0\xff\xc1\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x7f\xe0\x00\x3e\x00\x7f\xe0\xff\xc1\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x7f\xe0\x00\x3e\x00\x7f\xe0\xff\xc1\xf0\x00\x00\x00\x00"
+    b"\x00\x00\x00\x7f\xe0\x00\x3e\x00\x7f\xe0\xff\xc1\xf0\x00\x00\x00\x00"
+    b"\x07\xfe\x0f\x80\x1f\xff\xff\xf0\x03\xff\x07\xff\xff\xfc\x00\xf8\x00"
+    b"\x07\xfe\x0f\x80\x1f\xff\xff\xf0\x03\xff\x07\xff\xff\xfc\x00\xf8\x00"
+    b"\x07\xfe\x0f\x80\x1f\xff\xff\xf0\x03\xff\x07\xff\xff\xfc\x00\xf8\x00"
+    b"\x07\xfe\x0f\x80\x1f\xff\xff\xf0\x03\xff\x07\xff\xff\xfc\x00\xf8\x00"
+    b"\x07\xfe\x0f\x80\x1f\xff\xff\xf0\x03\xff\x07\xff\xff\xfc\x00\xf8\x00"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x0f\x83\xff\x07\xc0\x00\x7c\x1f\x07\xc0"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x0f\x83\xff\x07\xc0\x00\x7c\x1f\x07\xc0"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x0f\x83\xff\x07\xc0\x00\x7c\x1f\x07\xc0"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x0f\x83\xff\x07\xc0\x00\x7c\x1f\x07\xc0"
+    b"\x00\x00\x00\x00\x00\x07\xfe\x0f\x83\xff\x07\xc0\x00\x7c\x1f\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x3e\x00\x7f\xe0\x07\xc1\xf0\x7f\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x3e\x00\x7f\xe0\x07\xc1\xf0\x7f\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x3e\x00\x7f\xe0\x07\xc1\xf0\x7f\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x3e\x00\x7f\xe0\x07\xc1\xf0\x7f\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x3e\x00\x7f\xe0\x07\xc1\xf0\x7f\xe0\x07\xc0"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\x07\xc0\x00\x7c\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\x07\xc0\x00\x7c\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\x07\xc0\x00\x7c\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\x07\xc0\x00\x7c\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x00\x3f\xff\x80\x00\x07\xc0\x00\x7c\x00\x00\x00"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x03\xff\xff\xff\xff\xff\xe0\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x03\xff\xff\xff\xff\xff\xe0\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x03\xff\xff\xff\xff\xff\xe0\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x03\xff\xff\xff\xff\xff\xe0\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x3f\xf0\x03\xff\xff\xff\xff\xff\xe0\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x00\x00\x0f\x80\x00\xf8\x3e\x00\x7f\xff\xf8\x00"
+    b"\x07\xc1\xff\xfc\x1f\x00\x00\x0f\x80\x00\xf8\x3e\x00\x7f\xff\xf8\x00"
+    b"\x07\xc1\xff\xfc\x1f\x00\x00\x0f\x80\x00\xf8\x3e\x00\x7f\xff\xf8\x00"
+    b"\x07\xc1\xff\xfc\x1f\x00\x00\x0f\x80\x00\xf8\x3e\x00\x7f\xff\xf8\x00"
+    b"\x07\xc1\xff\xfc\x1f\x00\x00\x0f\x80\x00\xf8\x3e\x00\x7f\xff\xf8\x00"
+    b"\x07\xc1\xff\xfc\x1f\x07\xc0\x0f\xfc\x1f\x07\xc0\x00\x7c\x00\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xc0\x0f\xfc\x1f\x07\xc0\x00\x7c\x00\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xc0\x0f\xfc\x1f\x07\xc0\x00\x7c\x00\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xc0\x0f\xfc\x1f\x07\xc0\x00\x7c\x00\xff\xc0"
+    b"\x07\xc1\xff\xfc\x1f\x07\xc0\x0f\xfc\x1f\x07\xc0\x00\x7c\x00\xff\xc0"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7c\x1f\xff\xc0\x0f\xfc\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7c\x1f\xff\xc0\x0f\xfc\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7c\x1f\xff\xc0\x0f\xfc\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7c\x1f\xff\xc0\x0f\xfc\x00\x00\x00"
+    b"\x07\xc0\x00\x00\x1f\x07\xff\xf0\x7c\x1f\xff\xc0\x0f\xfc\x00\x00\x00"
+    b"\x07\xff\xff\xff\xff\x00\x00\x0f\xff\xff\x07\xfe\x00\x03\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x00\x0f\xff\xff\x07\xfe\x00\x03\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x00\x0f\xff\xff\x07\xfe\x00\x03\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x00\x0f\xff\xff\x07\xfe\x00\x03\xe0\x07\xc0"
+    b"\x07\xff\xff\xff\xff\x00\x00\x0f\xff\xff\x07\xfe\x00\x03\xe0\x07\xc0"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
@@ -1,11 +1,21 @@
 #!/usr/bin/python
 
+import argparse
+
 import gfx.adalogo as adalogo
 import gfx.adaqrcode as adaqrcode
 from adafruit_thermal import AdafruitThermal
 from enums import Barcode
 
-printer = AdafruitThermal("/dev/serial0", 9600, timeout=5)
+parser = argparse.ArgumentParser(
+    description="Print a test page on the thermal printer.")
+parser.add_argument("--port", default="/dev/serial0",
+                    help="the serial port, e.g. /dev/ttyUSB0 for USB")
+parser.add_argument("--baud", type=int, default=9600,
+                    help="the baud rate, from the self-test page")
+args = parser.parse_args()
+
+printer = AdafruitThermal(args.port, args.baud, timeout=5)
 
 
 def test_sizes():